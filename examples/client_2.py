@@ -25,19 +25,15 @@ def main():
 
 
         while True:
-            # read image
-            _start_time = time.time()
-            valid, array = shared_array.read()
+            # wait for the next image and read it
+            valid, array = shared_array.read(block=True, timeout=1.0)
 
             if valid:
-                print("time for reading: %3.3f ms" % ((time.time()-_start_time) * 1000))
                 print("elapsed time write/read: %3.3f ms" % shared_array.read_time_ms)
                 print("array shape: %s" % str(array.shape))
                 print("array sum: %i" % np.sum(array))
                 # print(array)
                 print()
-
-            time.sleep(0)
     except Exception:
         traceback.print_exc()
 
@@ -22,7 +22,7 @@ def main():
     # create mapping NdShArray
     _tag = "My_NdShArray"
     print("using tag for sharing the numpy array: %s" % _tag)
-    shared_array = NdShArray(_tag, r_w='w')  # Note: r_w='r' is must be specified
+    shared_array = NdShArray(_tag, r_w='w', slots=2)  # Note: r_w='r' is must be specified
 
     # write array to the shared_array
     array = (255*np.random.random(_shape_vid).astype(np.float32)).astype(np.uint8)  # simulate a noisy image
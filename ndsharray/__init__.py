@@ -5,7 +5,7 @@ from ndsharray.ndsharray import supported_types
 
 __author__ = 'Rune Monzel'
 __email__ = 'runemonzel@googlemail.com'
-__version__ = '1.1.4'
+__version__ = '1.2.0'
 __all__ = ["NdShArray",
            "supported_types"]
 
@@ -8,7 +8,10 @@ import mmap
 import uuid
 import time
 import sys
-from typing import Union, Tuple
+import contextlib
+import ctypes
+import platform
+from typing import Union, Tuple, Iterator, Callable
 import struct
 import warnings
 
@@ -62,6 +65,111 @@ def bytes_to_int(b: bytes, *, signed: bool = False) -> int:
     return int.from_bytes(b, byteorder='big', signed=signed)
 
 
+"""
+:var protocol_version: version of the protocol of the slot header, a reading process does not decode numpy arrays of
+                       another protocol version
+"""
+protocol_version = 2
+
+"""
+:var ndarray_mmap_header: native-endian header of the mmap of the ndarray: number of slots (uint64) and index of the
+                          latest written slot (uint64)
+"""
+ndarray_mmap_header = struct.Struct("=QQ")
+
+"""
+:var slot_headers: cache of the slot header structs for each number of dimensions, see get_slot_header
+"""
+slot_headers = {}
+
+
+def get_slot_header(ndim: int) -> struct.Struct:
+    """
+    returns the fixed-layout native-endian header of a slot for a numpy array with ndim dimensions: write-time (double),
+    protocol version (uint16), numpy dtype index (uint16), number of dimensions (uint32) and the length of each
+    axis (int64), thus the header is encoded and decoded with a single call
+
+    :param ndim: number of dimensions of the numpy array
+    :return slot_header:
+    """
+    _slot_header = slot_headers.get(ndim)
+    if _slot_header is None:
+        _slot_header = slot_headers[ndim] = struct.Struct("=dHHI%dq" % ndim)
+    return _slot_header
+
+
+"""
+:var futex_syscalls: number of the futex system call on linux for the different machines, the futex is used to wake up
+                     the reading processes as soon as a new numpy array has been written
+"""
+futex_syscalls = {"x86_64": 202,
+                  "i386": 240,
+                  "i686": 240,
+                  "armv7l": 240,
+                  "aarch64": 98,
+                  "riscv64": 98,
+                  "ppc64le": 221,
+                  "s390x": 238}
+FUTEX_WAIT = 0
+FUTEX_WAKE = 1
+
+
+class Timespec(ctypes.Structure):
+    """
+    struct timespec of the c standard library, used for the timeout of the futex system call
+    """
+    _fields_ = [("tv_sec", ctypes.c_long),
+                ("tv_nsec", ctypes.c_long)]
+
+
+def load_futex() -> Union[None, Callable]:
+    """
+    loads the syscall function of the c standard library if the futex system call is available (linux only)
+
+    :return syscall: None if the futex system call is not available
+    """
+    if not sys.platform.startswith("linux") or platform.machine() not in futex_syscalls:
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True).syscall
+    except (OSError, AttributeError):
+        return None
+
+
+"""
+:var libc_syscall: syscall function of the c standard library, None if the futex system call is not available
+"""
+libc_syscall = load_futex()
+
+
+def futex_wait(address: int, value: int, timeout: Union[None, float] = None) -> None:
+    """
+    sleeps until the 32 bit integer at the address is woken up by futex_wake, the futex system call returns
+    immediately if the integer at the address is not equal to value
+
+    :param address: address of the 32 bit integer in the shared memory
+    :param value: expected value of the 32 bit integer
+    :param timeout: timeout in seconds, None for waiting forever
+    :return None:
+    """
+    _timespec = None
+    if timeout is not None:
+        _timespec = ctypes.byref(Timespec(int(timeout), int((timeout % 1.0) * 1e9)))
+    libc_syscall(ctypes.c_long(futex_syscalls[platform.machine()]), ctypes.c_void_p(address),
+                 ctypes.c_int(FUTEX_WAIT), ctypes.c_uint32(value), _timespec, None, ctypes.c_int(0))
+
+
+def futex_wake(address: int) -> None:
+    """
+    wakes up all processes which are sleeping in futex_wait on the 32 bit integer at the address
+
+    :param address: address of the 32 bit integer in the shared memory
+    :return None:
+    """
+    libc_syscall(ctypes.c_long(futex_syscalls[platform.machine()]), ctypes.c_void_p(address),
+                 ctypes.c_int(FUTEX_WAKE), ctypes.c_int(2**31 - 1), None, None, ctypes.c_int(0))
+
+
 def str_to_bytes(s: str) -> bytes:
     """
     converts string to bytes
@@ -89,11 +197,14 @@ class NdShArray(object):
     """
 
     def __init__(self, name: str, array: np.ndarray = np.ndarray((0, ), dtype=np.uint8),
-                 r_w: Union[str, None] = None):
+                 r_w: Union[str, None] = None, slots: int = 1):
         """
         :param name:
         :param array:
         :param r_w: 'r' or 'w' for 'read' or 'write' functionality, must be specified
+        :param slots: number of preallocated slots (ring buffer) of the writing NdShArray, the writer fills the next
+                      slot while the readers still read the latest slot, thus readers do not see torn numpy arrays even
+                      at high frame rates; the reading NdShArray gets the number of slots from the writing one
         """
         object.__init__(self)
 
@@ -129,12 +240,23 @@ class NdShArray(object):
 
         self._is_valid = False
 
-        # buffer size of the _mmap_ndarray
-        _bytes = self._array_to_bytes(self._array)
-        self._buffer_size: int = len(_bytes)
+        # number of slots of the ring buffer and the index of the latest written slot
+        if int(slots) < 1:
+            raise ValueError("input argument 'slots' must be at least 1.")
+        self._slots: int = int(slots)
+        self._slot: int = self._slots - 1
 
-        # create the mmap which holds the name of the ndarray mmap
-        self._mmap, self._fd = self._create_mmap(self._name, len(self.ndarray_mmap_name), r_w=self._access)
+        # size of one slot and buffer size of the _mmap_ndarray
+        self._frame_size: int = self._get_frame_size(self._array.dtype, self._array.shape)
+        self._buffer_size: int = 0
+
+        # create the mmap which holds the name of the ndarray mmap and the notification counter behind it, the
+        # counter is increased for every written numpy array
+        _notify_offset = (len(self.ndarray_mmap_name) + 3) // 4 * 4
+        self._mmap, self._fd = self._create_mmap(self._name, _notify_offset + 4, r_w=self._access)
+        self._notify: Union[None, np.ndarray] = np.frombuffer(self._mmap, dtype=np.uint32, count=1,
+                                                              offset=_notify_offset)
+        self._notify_seen: int = -1  # the first wait_for_new returns immediately
 
         # create ndarray mmap
         self._is_valid = self._create_ndarray_mmap()
@@ -144,6 +266,9 @@ class NdShArray(object):
 
     def __del__(self):
 
+        # release the notification counter, otherwise the mmap can not be closed
+        self._notify = None
+
         # closing the mmap
         if hasattr(self, "_mmap"):
             self._close_mmap(self._mmap, self._fd)
@@ -192,6 +317,15 @@ class NdShArray(object):
         """
         return self._access
 
+    @property
+    def slots(self) -> int:
+        """
+        number of slots (ring buffer) of the mmap of the ndarray
+
+        :return slots:
+        """
+        return self._slots
+
     @property
     def read_time_ms(self) -> float:
         """
@@ -205,56 +339,85 @@ class NdShArray(object):
         """
         encodes a numpy array to bytes using an own protocol
 
-        protocol usage:
-        - write-time (8 bytes)
-        - numpy dtype index (integer, 8 bytes)
-        - number of dimension (integer, 8 bytes)
-        - length of axis (array dimension) 0 (integer, 8 bytes)
-        - length of axis (array dimension) 1 (integer, 8 bytes)
-        - length of axis (array dimension) 2 (integer, 8 bytes)
-        - length of axis (array dimension) . (integer, 8 bytes)
-        - length of axis (array dimension) . (integer, 8 bytes)
-        - length of axis (array dimension) n (integer, 8 bytes)
+        the mmap of the ndarray starts with the number of slots (uint64) and the index of the latest written slot
+        (uint64), see ndarray_mmap_header, followed by the slots, where each slot holds one numpy array using this
+        protocol
+
+        protocol usage (native-endian, see get_slot_header):
+        - write-time (double, 8 bytes)
+        - protocol version (uint16, 2 bytes)
+        - numpy dtype index (uint16, 2 bytes)
+        - number of dimension (uint32, 4 bytes)
+        - length of axis (array dimension) 0 (int64, 8 bytes)
+        - length of axis (array dimension) 1 (int64, 8 bytes)
+        - length of axis (array dimension) . (int64, 8 bytes)
+        - length of axis (array dimension) n (int64, 8 bytes)
         - bytes of numpy array
-        - write-time (8 bytes)
-
-        note: size of integer may differ because the maximum integer size sys.maxsize will be used (on python3, amd64
-        it is 8 byte)
+        - write-time (double, 8 bytes)
 
         :param array: byte-encoded numpy array using an own protocol
         :return:
         """
-        global supported_types
-
         if not isinstance(array, np.ndarray):
             raise TypeError("array must be from type np.ndarray.")
 
-        if array.dtype not in supported_types:
+        _time = self._next_write_time()
+        return (get_slot_header(array.ndim).pack(_time, protocol_version, self._get_dtype_index(array.dtype),
+                                                 array.ndim, *array.shape)
+                + array.tobytes() + struct.pack("d", _time))
+
+    @staticmethod
+    def _get_dtype_index(dtype: np.dtype) -> int:
+        """
+        returns the index of the numpy dtype in supported_types which is saved in the slot header, see _array_to_bytes
+        for the protocol
+
+        :param dtype:
+        :return dtype_index:
+        """
+        global supported_types
+
+        if dtype not in supported_types:
             raise NotImplementedError("%s is a numpy.dtype which is not supported. "
                                       "The following numpy.dtypes are supported: %s"
-                                      % (str(array.dtype), str([_t.__name__ for _t in supported_types])))
+                                      % (str(dtype), str([_t.__name__ for _t in supported_types])))
+
+        return supported_types.index(dtype)
+
+    @staticmethod
+    def _get_frame_size(dtype: np.dtype, shape: Tuple[int, ...]) -> int:
+        """
+        returns the number of bytes of the byte-encoded numpy array (see _array_to_bytes) without encoding it, this is
+        the size of one slot
+
+        :param dtype:
+        :param shape:
+        :return frame_size:
+        """
+        return get_slot_header(len(shape)).size + int(np.prod(shape, dtype=np.int64)) * dtype.itemsize + 8
+
+    def _next_write_time(self) -> float:
+        """
+        returns the write-time for the next write, the write-time is always increasing and unique
 
+        :return:
+        """
         _now = time.monotonic()
         if _now <= self._write_time:
             _now = float(np.nextafter(self._write_time, float('inf')))  # +1 ULP
         self._write_time = _now
-        _time = struct.pack("d", self._write_time)
-
-        _bytes = b''
-        _bytes += _time
-        _bytes += int_to_bytes(supported_types.index(array.dtype))
-        _bytes += int_to_bytes(int(array.ndim))
-        for s in range(array.ndim):
-            _bytes += int_to_bytes(int(array.shape[s]))
-        _bytes += array.tobytes()
-        _bytes += _time
+        return self._write_time
 
-        return _bytes
-
-    def _bytes_to_array(self, _bytes: bytes) -> Tuple[bool, bool, np.ndarray]:
+    def _buffer_to_array(self, _buffer: mmap.mmap, offset: int = 0,
+                         copy: bool = False) -> Tuple[bool, bool, np.ndarray]:
         """
+        decodes the numpy array directly from the buffer (mmap) without reading the whole buffer into bytes, see
+        _array_to_bytes for the used protocol
 
-        :param _bytes:
+        :param _buffer: mmap of the ndarray
+        :param offset: offset of the slot in the buffer
+        :param copy: if True, the numpy array will be copied out of the buffer, otherwise the numpy array is a view of
+                     the buffer
         :return mmap_correct: boolean shows, if the mmap does fit to the size of the numpy ndarray, if it is not
                               correct, the mmap should be re-initialized and the buffer should be read out again
                               if mmap_correct is False, validity will be also False and the numpy array will be
@@ -270,35 +433,31 @@ class NdShArray(object):
         _validity = False
         _array = np.ndarray((0, ))
 
-        idx = 0
-        _time_start = struct.unpack("d", _bytes[idx:8])[0]
-        idx += 8
-        _np_dtype = supported_types[bytes_to_int(_bytes[idx:idx+n_bytes_for_int])]
-        idx += n_bytes_for_int
-        if _np_dtype != self._array.dtype:
+        # the header is decoded with a single call, assuming the dimension of the current numpy array
+        _slot_header = get_slot_header(self._array.ndim)
+        try:
+            _header = _slot_header.unpack_from(_buffer, offset)
+        except struct.error:
             return False, False, _array
-        _np_dim = bytes_to_int(_bytes[idx:idx+n_bytes_for_int])
-        idx += n_bytes_for_int
-        if _np_dim != self._array.ndim:
+        _time_start, _version, _np_dtype_index, _np_dim = _header[:4]
+        _np_shape = _header[4:]
+        if _version != protocol_version or _np_dim != self._array.ndim or _np_shape != self._array.shape or \
+                _np_dtype_index >= len(supported_types) or supported_types[_np_dtype_index] != self._array.dtype:
             return False, False, _array
-        _np_shape = []
-        for s in range(_np_dim):
-            _np_shape.append(bytes_to_int(_bytes[idx:idx + n_bytes_for_int]))
-            idx += n_bytes_for_int
-        _np_shape = tuple(_np_shape)
-        if _np_shape != self._array.shape:
+        _np_dtype = self._array.dtype
+        idx = offset + _slot_header.size
+        _count = int(np.prod(_np_shape, dtype=np.int64))
+        if idx + _count * self._array.itemsize + 8 > len(_buffer):
             return False, False, _array
-        _byte_array = _bytes[idx:-8]
-        idx = len(_bytes) - 8
-        try:
-            _time_end = struct.unpack("d", _bytes[idx:])[0]
-        except ValueError:
-            _time_end = 0
 
-        _validity = _time_start == _time_end
+        # numpy's frombuffer returns a view of the buffer, the only copy is done if it is requested
+        _array = np.frombuffer(_buffer, dtype=_np_dtype, count=_count, offset=idx).reshape(_np_shape)
+        if copy:
+            _array = _array.copy()
+        idx += _array.nbytes
+        _time_end = struct.unpack_from("d", _buffer, idx)[0]
 
-        # check for mmap changes
-        _array = np.frombuffer(_byte_array, dtype=_np_dtype).reshape(_np_shape)
+        _validity = _time_start == _time_end
 
         return _mmap_correct, _validity, _array
 
@@ -315,16 +474,98 @@ class NdShArray(object):
         :param array: a numpy.ndarray which shall be saved in mmap
         :return None:
         """
-        _bytes = self._array_to_bytes(array)
+        if not isinstance(array, np.ndarray):
+            raise TypeError("array must be from type np.ndarray.")
+
+        _dtype_index = self._get_dtype_index(array.dtype)
 
         # check, if a new mmap has to be generated
         if self._array.dtype != array.dtype or self._array.ndim != array.ndim or self._array.shape != array.shape:
             self._array = array
-            self._buffer_size = len(_bytes)
+            self._frame_size = self._get_frame_size(array.dtype, array.shape)
+            self._create_ndarray_mmap()
+
+        # the next slot is written while the reading processes may still read the latest slot
+        _slot = (self._slot + 1) % self._slots
+        _offset = self._get_slot_offset(_slot)
+
+        # write the header in place, followed by a single copy of the array straight into the mmap
+        _time = self._next_write_time()
+        _slot_header = get_slot_header(array.ndim)
+        _slot_header.pack_into(self._ndarray_mmap, _offset, _time, protocol_version, _dtype_index, array.ndim,
+                               *array.shape)
+        _view = np.frombuffer(self._ndarray_mmap, dtype=array.dtype, count=array.size,
+                              offset=_offset+_slot_header.size)
+        np.copyto(_view.reshape(array.shape), array, casting='no')
+        del _view  # release the buffer, otherwise the mmap can not be closed
+        struct.pack_into("d", self._ndarray_mmap, _offset+self._frame_size-8, _time)
+
+        # publish the written slot as the latest one
+        self._publish_slot(_slot)
+        self._ndarray_mmap.flush()
+
+        # write name of ndarray mmap into mmap
+        self._mmap.seek(0)
+        self._mmap.write(str_to_bytes(self.ndarray_mmap_name))
+        self._mmap.flush()
+
+        self._notify_readers()
+
+    @contextlib.contextmanager
+    def writable(self, shape: Union[int, Tuple[int, ...]], dtype: np.dtype = np.float64) -> Iterator[np.ndarray]:
+        """
+        context manager which returns a writeable numpy array backed by the mmap, thus the array can be filled directly
+        in the shared memory without any copy. Leaving the with-block publishes the array to the reading processes by
+        stamping the write-time. If an exception is raised inside the with-block, the array will not be published.
+
+        Example:
+            with shared_array.writable((720, 1280, 3), np.uint8) as array:
+                camera.grab_into(array)
+
+        Important Note:
+            as with write, the mmap will be silently re-created if type, dimension or shape will be changed. The
+            returned numpy array must not be used after leaving the with-block.
+
+        :param shape: shape of the numpy array
+        :param dtype: numpy dtype of the numpy array
+        :return array: numpy.ndarray viewing the shared memory
+        """
+        if self._access != "w":
+            raise PermissionError("NdShArray '%s' is not writeable, use r_w='w'." % self._name)
+
+        dtype = np.dtype(dtype)
+        if isinstance(shape, (int, np.integer)):
+            shape = (int(shape), )
+        else:
+            shape = tuple(int(s) for s in shape)
+
+        _dtype_index = self._get_dtype_index(dtype)
+
+        # check, if a new mmap has to be generated
+        if self._array.dtype != dtype or self._array.shape != shape:
+            self._array = np.ndarray((0, ), dtype=dtype)  # drop the reference to the previous array
+            self._frame_size = self._get_frame_size(dtype, shape)
             self._create_ndarray_mmap()
 
-        self._ndarray_mmap.seek(0)
-        self._ndarray_mmap.write(_bytes)
+        # the next slot is filled while the reading processes may still read the latest slot
+        _slot = (self._slot + 1) % self._slots
+        _offset = self._get_slot_offset(_slot)
+
+        # a write-time of zero marks the array as not yet written for the reading processes
+        _slot_header = get_slot_header(len(shape))
+        _slot_header.pack_into(self._ndarray_mmap, _offset, 0.0, protocol_version, _dtype_index, len(shape), *shape)
+        self._array = np.frombuffer(self._ndarray_mmap, dtype=dtype, count=int(np.prod(shape, dtype=np.int64)),
+                                    offset=_offset+_slot_header.size).reshape(shape)
+
+        yield self._array
+
+        # stamp the trailing write-time first, thus readers never see a new leading write-time with an old trailing one
+        _time = self._next_write_time()
+        struct.pack_into("d", self._ndarray_mmap, _offset+self._frame_size-8, _time)
+        struct.pack_into("d", self._ndarray_mmap, _offset, _time)
+
+        # publish the written slot as the latest one
+        self._publish_slot(_slot)
         self._ndarray_mmap.flush()
 
         # write name of ndarray mmap into mmap
@@ -332,7 +573,47 @@ class NdShArray(object):
         self._mmap.write(str_to_bytes(self.ndarray_mmap_name))
         self._mmap.flush()
 
-    def read(self) -> Tuple[bool, np.ndarray]:
+        self._notify_readers()
+
+    def _notify_readers(self) -> None:
+        """
+        increases the notification counter and wakes up the reading processes which are waiting in wait_for_new
+
+        :return None:
+        """
+        self._notify += 1  # overflow of the 32 bit counter is intended
+        if libc_syscall is not None:
+            futex_wake(self._notify.ctypes.data)
+
+    def wait_for_new(self, timeout: Union[None, float] = None) -> bool:
+        """
+        sleeps until a new numpy array has been written since the last read. On linux the reading process is woken up
+        by the writing process (futex), on other operating systems the notification counter is polled.
+
+        :param timeout: timeout in seconds, None for waiting forever
+        :return new: True if a new numpy array has been written, False if the timeout occurred
+        """
+        _deadline = None if timeout is None else time.monotonic() + timeout
+        _sleep = 0.00001
+        while True:
+            _notify = int(self._notify[0])
+            if _notify != self._notify_seen:
+                return True
+
+            _timeout = None
+            if _deadline is not None:
+                _timeout = _deadline - time.monotonic()
+                if _timeout <= 0.0:
+                    return False
+
+            if libc_syscall is not None:
+                futex_wait(self._notify.ctypes.data, _notify, _timeout)
+            else:
+                time.sleep(_sleep if _timeout is None else min(_sleep, _timeout))
+                _sleep = min(2 * _sleep, 0.001)
+
+    def read(self, copy: bool = False, block: bool = False,
+             timeout: Union[None, float] = None) -> Tuple[bool, np.ndarray]:
         """
         reading the shared memory with mmap and numpy's frombuffer, which returns a view of the buffer and not a copy.
 
@@ -341,17 +622,33 @@ class NdShArray(object):
         to copy the result when the original object is mutable or untrusted."
         Source: https://numpy.org/doc/stable/reference/generated/numpy.frombuffer.html
 
+        Important Note:
+            the returned view is read-only and it will show the next numpy array of the writing process as soon as it
+            is written into the same mmap, the validity is only checked at the time of reading. Use copy=True to get a
+            snapshot of the numpy array.
+
+        :param copy: if True, a copy of the numpy array is returned instead of a view of the shared memory
+        :param block: if True, the reading process sleeps until a new valid numpy array has been written (see
+                      wait_for_new) instead of returning immediately
+        :param timeout: timeout in seconds for block=True, None for waiting forever
         :return validity: boolean displaying if the numpy array is ok or if it is either old or corrupt or not (e.g.
                           mixed numpy ndarray from previous writing). Note: validity is checked by checking if
                           buffer[0] and buffer[-1] have the same time stamp!
         :return array: numpy.ndarray
         """
-        global n_bytes_for_int, supported_types
+        if block:
+            _deadline = None if timeout is None else time.monotonic() + timeout
+            while self.wait_for_new(None if _deadline is None else max(_deadline - time.monotonic(), 0.0)):
+                _validity, _numpy_array = self.read(copy=copy)
+                if _validity:
+                    return _validity, _numpy_array
+            return False, self._array
 
         _recreated_map = False
         _mmap_correct = True
         _validity = False
         _numpy_array = self._array
+        self._notify_seen = int(self._notify[0])
 
         # get the ndarray mmap name
         self._mmap.seek(0)
@@ -361,26 +658,21 @@ class NdShArray(object):
             _recreated_map = True
 
         if self._is_valid:
-            # first stage of checking if new data have been arrived
-            self._ndarray_mmap.seek(0)
-            _bytes = self._ndarray_mmap.read(8)
+            # first stage of checking if new data have been arrived in the latest slot
             try:
-                _write_time = struct.unpack("d", _bytes)[0]
-            except ValueError:
+                _offset = self._get_slot_offset(ndarray_mmap_header.unpack_from(self._ndarray_mmap)[1])
+                _write_time = struct.unpack_from("d", self._ndarray_mmap, _offset)[0]
+            except struct.error:
                 _write_time = 0
-            if _write_time <= self._last_write_time and not _recreated_map:
+            if _write_time <= 0.0 or (_write_time <= self._last_write_time and not _recreated_map):
                 return False, _numpy_array
 
-            # without checking, read the whole buffer
-            _bytes += self._ndarray_mmap.read()
-
-            if len(_bytes) != self._buffer_size:
-                self._create_ndarray_mmap()
-
-            _mmap_correct, _validity, _numpy_array = self._bytes_to_array(_bytes)
+            _mmap_correct, _validity, _numpy_array = self._buffer_to_array(self._ndarray_mmap, _offset, copy=copy)
             if not _mmap_correct:
                 warnings.warn("The mmap of the ndarray seems to be corrupt and the used protocol does not fit.",
                               BytesWarning)
+                self._create_ndarray_mmap()
+                return False, _numpy_array
 
             # for efficiency
             self._array = _numpy_array
@@ -398,8 +690,6 @@ class NdShArray(object):
 
         :return:
         """
-        global n_bytes_for_int
-
         self._close_mmap(self._ndarray_mmap, self._ndarray_fd)
 
         # now rebuild the mmap
@@ -407,8 +697,11 @@ class NdShArray(object):
             # create new uuid
             self._uuid = uuid.uuid4().hex
 
+            self._buffer_size = ndarray_mmap_header.size + self._slots * self._frame_size
             self._ndarray_mmap, self._ndarray_fd = self._create_mmap(self.ndarray_mmap_name, self._buffer_size,
                                                                      r_w=self._access)
+            self._slot = self._slots - 1  # the first numpy array will be written into slot 0
+            ndarray_mmap_header.pack_into(self._ndarray_mmap, 0, self._slots, self._slot)
 
         elif self._access == "r":
             self._mmap.seek(0)
@@ -422,34 +715,28 @@ class NdShArray(object):
 
             try:
                 if self._is_valid:
-                    # create temporary mmap to get the dtype and dimension of the array
-                    _tmp_mmap, _tmp_fd = self._create_mmap(self.ndarray_mmap_name, 8+2*n_bytes_for_int, r_w="r")
-                    _tmp_mmap.seek(0)
-                    _bytes = _tmp_mmap.read(8+2*n_bytes_for_int)  # skip the time: +8
-                    idx = 8
-                    _np_dtype = supported_types[bytes_to_int(_bytes[idx:idx+n_bytes_for_int])]
-                    idx += n_bytes_for_int
-                    _np_dim = bytes_to_int(_bytes[idx:idx+n_bytes_for_int])
+                    # create temporary mmap to get the number of slots, the protocol version, the dtype and dimension
+                    # of the array (the first slot is always written first)
+                    _size = ndarray_mmap_header.size + get_slot_header(0).size
+                    _tmp_mmap, _tmp_fd = self._create_mmap(self.ndarray_mmap_name, _size, r_w="r")
+                    self._slots = ndarray_mmap_header.unpack_from(_tmp_mmap)[0]
+                    _, _version, _np_dtype_index, _np_dim = get_slot_header(0).unpack_from(_tmp_mmap,
+                                                                                           ndarray_mmap_header.size)
                     self._close_mmap(_tmp_mmap, _tmp_fd)
+                    if _version != protocol_version:
+                        raise ValueError("protocol version %i is not supported." % _version)
+                    _np_dtype = supported_types[_np_dtype_index]
 
                     # create temporary mmap to get the shape of the array
-                    _tmp_2_mmap, _tmp_2_fd = self._create_mmap(self.ndarray_mmap_name,
-                                                               8 + 2 * n_bytes_for_int + _np_dim * n_bytes_for_int,
-                                                               r_w="r")
-                    _tmp_2_mmap.seek(8+2*n_bytes_for_int)  # skip the time, dtype and dimension
-                    # read shape
-                    _bytes += _tmp_2_mmap.read(_np_dim * n_bytes_for_int)
-                    idx = 8 + 2 * n_bytes_for_int
-                    _np_shape = []
-                    for s in range(_np_dim):
-                        _np_shape.append(bytes_to_int(_bytes[idx:idx + n_bytes_for_int]))
-                        idx += n_bytes_for_int
-                    _np_shape = tuple(_np_shape)
+                    _size = ndarray_mmap_header.size + get_slot_header(_np_dim).size
+                    _tmp_2_mmap, _tmp_2_fd = self._create_mmap(self.ndarray_mmap_name, _size, r_w="r")
+                    _np_shape = get_slot_header(_np_dim).unpack_from(_tmp_2_mmap, ndarray_mmap_header.size)[4:]
                     self._close_mmap(_tmp_2_mmap, _tmp_2_fd)
 
                     # rebuild _array and get the length of the byte array -> super lazy and inefficient...
                     self._array = np.ndarray(_np_shape, dtype=_np_dtype)
-                    self._buffer_size = len(self._array_to_bytes(self._array))
+                    self._frame_size = len(self._array_to_bytes(self._array))
+                    self._buffer_size = ndarray_mmap_header.size + self._slots * self._frame_size
 
                     self._ndarray_mmap, self._ndarray_fd = self._create_mmap(self.ndarray_mmap_name, self._buffer_size,
                                                                              r_w=self._access)
@@ -457,6 +744,25 @@ class NdShArray(object):
                 self._is_valid = False
         return self._is_valid
 
+    def _get_slot_offset(self, slot: int) -> int:
+        """
+        returns the offset of a slot in the mmap of the ndarray
+
+        :param slot: index of the slot
+        :return offset:
+        """
+        return ndarray_mmap_header.size + slot * self._frame_size
+
+    def _publish_slot(self, slot: int) -> None:
+        """
+        publishes the index of the latest written slot to the reading processes
+
+        :param slot: index of the slot
+        :return None:
+        """
+        ndarray_mmap_header.pack_into(self._ndarray_mmap, 0, self._slots, slot)
+        self._slot = slot
+
     @staticmethod
     def _create_mmap(name: str, buffer_size: int, r_w: str) -> Tuple[mmap.mmap, Union[None, int]]:
         """
@@ -502,9 +808,14 @@ class NdShArray(object):
         # closing the mmap
         if _mmap is not None:
             # closing the mmap
-            _mmap.close()
-            while not _mmap.closed:
-                time.sleep(0.001)
+            try:
+                _mmap.close()
+            except BufferError:
+                # numpy arrays are still viewing the mmap, it will be released as soon as they are garbage collected
+                pass
+            else:
+                while not _mmap.closed:
+                    time.sleep(0.001)
 
         # closing the ndarray file
         if os.name == "posix":
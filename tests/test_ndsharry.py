@@ -144,13 +144,8 @@ class Testndsharray(unittest.TestCase):
                     self._read_write_event.wait(timeout=5)
                     self._read_write_event.clear()
 
-                    status = False
-                    _read_array = np.ndarray((1, ), dtype=_type)
                     _timeout = 5
-                    _time_start = time.time()
-                    while not status and (time.time() - _time_start) <= _timeout:
-                        status, _read_array = self._ndsharray_read.read()
-                        time.sleep(0.001)
+                    status, _read_array = self._ndsharray_read.read(block=True, timeout=_timeout)
                     
                     if status:
                         _result = np.array_equal(_write_array, _read_array)
@@ -186,6 +181,98 @@ class Testndsharray(unittest.TestCase):
             logger.exception("Error occurred:")
             raise e
 
+    def test_writable(self):
+        """
+        fills the shared memory in place with the writable context manager
+
+        :return:
+        """
+        _ndsharray_write = NdShArray("%s_writable" % self._name, r_w="w")
+        _ndsharray_read = NdShArray("%s_writable" % self._name, r_w="r")
+
+        _, _ = _ndsharray_read.read()  # must be a first read before write
+
+        _write_array = (np.random.random((48, 64)) * 255).astype(np.uint16)
+        with _ndsharray_write.writable(_write_array.shape, _write_array.dtype) as _array:
+            _array[:] = _write_array
+            status, _ = _ndsharray_read.read()
+            self.assertFalse(status)  # not published inside the with-block
+
+        status, _read_array = _ndsharray_read.read()
+        self.assertTrue(status)
+        self.assertTrue(np.array_equal(_write_array, _read_array))
+
+    def test_read_copy(self):
+        """
+        read returns a read-only view of the shared memory, read(copy=True) returns a snapshot
+
+        :return:
+        """
+        _ndsharray_write = NdShArray("%s_read_copy" % self._name, r_w="w")
+        _ndsharray_read = NdShArray("%s_read_copy" % self._name, r_w="r")
+
+        _ndsharray_write.write(np.zeros((16, 16), dtype=np.float32))
+        status, _view = _ndsharray_read.read()
+        self.assertTrue(status)
+        self.assertFalse(_view.flags.writeable)
+
+        _ndsharray_write.write(np.ones((16, 16), dtype=np.float32))
+        status, _copy = _ndsharray_read.read(copy=True)
+        self.assertTrue(status)
+        self.assertTrue(np.all(_view == 1))  # the view shows the shared memory
+        self.assertTrue(_copy.flags.owndata)
+
+        _ndsharray_write.write(np.full((16, 16), 2, dtype=np.float32))
+        self.assertTrue(np.all(_copy == 1))
+
+    def test_slots(self):
+        """
+        a ring buffer with three slots, the reader still reads the latest slot while the writer fills the next one
+
+        :return:
+        """
+        _ndsharray_write = NdShArray("%s_slots" % self._name, r_w="w", slots=3)
+        _ndsharray_read = NdShArray("%s_slots" % self._name, r_w="r")
+        self.assertEqual(_ndsharray_read.slots, 3)
+
+        for i in range(5):
+            _ndsharray_write.write(np.full((32, 8), i, dtype=np.int32))
+            status, _read_array = _ndsharray_read.read()
+            self.assertTrue(status)
+            self.assertTrue(np.all(_read_array == i))
+
+        with _ndsharray_write.writable((32, 8), np.int32) as _array:
+            _array[:] = 5
+            status, _read_array = _ndsharray_read.read(copy=True)
+            self.assertFalse(status)
+            self.assertTrue(np.all(_read_array == 4))
+
+        status, _read_array = _ndsharray_read.read()
+        self.assertTrue(status)
+        self.assertTrue(np.all(_read_array == 5))
+
+    def test_wait_for_new(self):
+        """
+        wait_for_new returns as soon as a new numpy array has been written or the timeout occurred
+
+        :return:
+        """
+        _ndsharray_write = NdShArray("%s_wait" % self._name, r_w="w")
+        _ndsharray_read = NdShArray("%s_wait" % self._name, r_w="r")
+
+        self.assertTrue(_ndsharray_read.wait_for_new(timeout=0.1))  # the initial numpy array has not been read yet
+        _, _ = _ndsharray_read.read()
+        self.assertFalse(_ndsharray_read.wait_for_new(timeout=0.1))
+
+        _ndsharray_write.write(np.arange(10))
+        self.assertTrue(_ndsharray_read.wait_for_new(timeout=0.1))
+        status, _read_array = _ndsharray_read.read(block=True, timeout=0.1)
+        self.assertTrue(status)
+        self.assertTrue(np.array_equal(_read_array, np.arange(10)))
+
+        status, _ = _ndsharray_read.read(block=True, timeout=0.1)
+        self.assertFalse(status)
+
     @staticmethod
     def disconnect():
         """
@@ -234,13 +321,8 @@ def _testing_process(_name: str,
             _write_event.wait(timeout=5)
             _write_event.clear()
 
-            _status = False
-            _result = np.ndarray((1, 1))
             _timeout = 5
-            _time_start = time.time()
-            while not _status and (time.time() - _time_start) <= _timeout:
-                _status, _result = _nds_read.read()
-                time.sleep(0.001)
+            _status, _result = _nds_read.read(block=True, timeout=_timeout)
 
             _read_write_event.set()
 